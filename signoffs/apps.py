@@ -13,6 +13,8 @@ class SignoffsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
 
     def ready(self):
+        from signoffs import checks  # noqa: F401 -- register system checks
+
         if settings.SIGNOFFS_AUTODISCOVER_MODULE:
             from django.utils.module_loading import autodiscover_modules
 
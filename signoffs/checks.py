@@ -0,0 +1,114 @@
+"""
+System checks for signoffs configuration.
+
+URL templates are a fast path that bypasses `reverse()`, so nothing ties them to the URLconf at runtime.
+Verify, once at startup, that each template formats to the same URL its named URL pattern reverses to.
+
+The check reverses with the default script prefix ("/") and the default language, so it can't detect
+a language prefix that depends on the active language at request time.
+Templates are prefixed with the request's script prefix at runtime, so a sub-path deployment is fine.
+"""
+from django.core import checks
+from django.urls import NoReverseMatch, reverse
+
+SAMPLE_PK = 1
+
+URL_SETTINGS = (
+    "save_url_name",
+    "save_url_template",
+    "revoke_url_name",
+    "revoke_url_template",
+)
+
+
+def get_url_settings(obj_type):
+    """
+    Return dict of url names and templates for the url service injected into the given Signoff or Approval Type
+
+    Read from the service class and its initializer kwargs, without instantiating the service,
+    which may need a real owner instance.  Return None if the type has no url service.
+    """
+    for klass in obj_type.__mro__:
+        descriptor = vars(klass).get("urls")
+        if descriptor is not None:
+            break
+    else:
+        return None
+    service_class = getattr(descriptor, "service_class", None)
+    if service_class is None:
+        return None
+    kwargs = getattr(descriptor, "service_class_kwargs", {})
+    # mirrors the url services' initializers:  kwarg or class default
+    return {
+        attr: kwargs.get(attr) or getattr(service_class, attr, "")
+        for attr in URL_SETTINGS
+    }
+
+
+def check_url_template(obj_type, url_name, url_template, args=()):
+    """Return list of errors if url_template does not produce the same URL as reversing url_name"""
+    if not (url_name and url_template):
+        return []
+    try:
+        expected = reverse(url_name, args=args)
+    except NoReverseMatch as e:
+        return [
+            checks.Error(
+                f"{obj_type.id}: URL '{url_name}' for template '{url_template}' could not be reversed: {e}",
+                obj=obj_type,
+                id="signoffs.E001",
+            )
+        ]
+    actual = url_template.format(pk=SAMPLE_PK)
+    if actual != expected:
+        return [
+            checks.Error(
+                f"{obj_type.id}: URL template '{url_template}' gives '{actual}', "
+                f"but URL '{url_name}' reverses to '{expected}'",
+                hint="Update the URL template to match the URL pattern, or remove it to use reverse(). "
+                "Checked with the root script prefix and default language only - "
+                "don't use templates for language-prefixed (i18n_patterns) URLs.",
+                obj=obj_type,
+                id="signoffs.E002",
+            )
+        ]
+    return []
+
+
+def url_template_errors(signoff_types=(), approval_types=()):
+    """Return list of errors for all url templates that disagree with their URL pattern"""
+    errors = []
+    for signoff_type in signoff_types:
+        urls = get_url_settings(signoff_type)
+        if urls is None:
+            continue
+        errors += check_url_template(
+            signoff_type,
+            urls["save_url_name"],
+            urls["save_url_template"],
+        )
+        errors += check_url_template(
+            signoff_type,
+            urls["revoke_url_name"],
+            urls["revoke_url_template"],
+            args=(SAMPLE_PK,),
+        )
+    for approval_type in approval_types:
+        urls = get_url_settings(approval_type)
+        if urls is None:
+            continue
+        errors += check_url_template(
+            approval_type,
+            urls["revoke_url_name"],
+            urls["revoke_url_template"],
+            args=(SAMPLE_PK,),
+        )
+    return errors
+
+
+@checks.register(checks.Tags.urls)
+def check_url_templates(app_configs=None, **kwargs):
+    """System check: all registered Signoff and Approval Types have consistent URL templates"""
+    from signoffs import registry
+
+    return url_template_errors(registry.signoffs.values(), registry.approvals.values())
@@ -156,7 +156,10 @@ class AbstractSignoffRevokeForm(forms.Form):
     def _get_signet(self, signoff_type):
         signetModel = signoff_type.get_signetModel()
         try:
-            return signetModel.objects.get(pk=self.cleaned_data.get("signet_pk"))
+            # revoke validation checks the signet's revoked state - fetch it in the same query
+            return signetModel.objects.with_revoked_receipt().get(
+                pk=self.cleaned_data.get("signet_pk")
+            )
         except signetModel.DoesNotExist as e:
             raise ValidationError(str(e))
 
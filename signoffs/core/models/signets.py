@@ -8,11 +8,12 @@ A `Signet` is not intended to be edited.  Create them, revoke them, re-create th
 To revoke a `Signet`, we can simply delete the `Signet` record.
 To maintain a "blame" history, we can instead record who and when the signet was revoked with a `RevokedSignet`.
 """
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import (
+    FieldDoesNotExist,
     FieldError,
     ImproperlyConfigured,
     PermissionDenied,
@@ -51,10 +52,12 @@ class SignetQuerySet(models.QuerySet):
 
     def with_revoked_receipt(self):
         """Select related 'revoked' records"""
+        # select_related only validates field names when the query is evaluated, so check the relation up front
         try:
-            return self.select_related("revoked")
-        except FieldError:  # no related manager  --> no revoked signets
+            self.model._meta.get_field("revoked")
+        except FieldDoesNotExist:  # no related manager  --> no revoked signets
             return self
+        return self.select_related("revoked")
 
     def signoffs(self, signoff_id=None, subject=None):
         """
@@ -107,6 +110,12 @@ def get_signet_defaults(signet):
     }
 
 
+@lru_cache(maxsize=None)
+def _import_signet_defaults(import_path):
+    """Import the SIGNOFFS_SIGNET_DEFAULTS dict or callable given by dotted path, once per path"""
+    return dynamic_import(import_path)
+
+
 class AbstractSignet(models.Model):
     """
     Abstract base class for all Signet models
@@ -222,7 +231,8 @@ class AbstractSignet(models.Model):
     def get_signet_defaults(self):
         """Return dict of default field values for this signet - signet MUST have user relation!"""
         defaults = settings.SIGNOFFS_SIGNET_DEFAULTS
-        defaults = dynamic_import(defaults) if isinstance(defaults, str) else defaults
+        if isinstance(defaults, str):
+            defaults = _import_signet_defaults(defaults)
         return (
             get_signet_defaults(self)
             if defaults is None
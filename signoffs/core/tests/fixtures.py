@@ -24,24 +24,40 @@ def get_perm(codename, name=None, content_type=None):
     return perm
 
 
+def get_perms(*codenames, content_type=None):
+    """Get or create and return a list of permissions with given codenames, fetching existing ones in one query"""
+    if not codenames:
+        return []
+    content_type = content_type or auth_content_type()
+    existing = {
+        perm.codename: perm
+        for perm in Permission.objects.filter(
+            codename__in=codenames, content_type=content_type
+        )
+    }
+    return [
+        existing.get(codename) or get_perm(codename, content_type=content_type)
+        for codename in codenames
+    ]
+
+
+def _resolve_perms(perms, content_type=None):
+    """Return list of Permission objects for perms, which may be permission instances or codenames"""
+    codenames = [perm for perm in perms if type(perm) is str]
+    lookup = dict(zip(codenames, get_perms(*codenames, content_type=content_type)))
+    return [lookup[perm] if type(perm) is str else perm for perm in perms]
+
+
 def revoke_all_permissions(user):
     user.user_permissions.clear()
 
 
 def revoke_permissions(user, *perms, content_type=None):
-    content_type = content_type or auth_content_type()
-    for perm in perms:
-        if type(perm) is str:
-            perm = get_perm(perm, content_type=content_type)
-        user.user_permissions.remove(perm)
+    user.user_permissions.remove(*_resolve_perms(perms, content_type=content_type))
 
 
 def grant_permissions(user, *perms, content_type=None):
-    content_type = content_type or auth_content_type()
-    for perm in perms:
-        if type(perm) is str:
-            perm = get_perm(perm, content_type=content_type)
-        user.user_permissions.add(perm)
+    user.user_permissions.add(*_resolve_perms(perms, content_type=content_type))
 
 
 def get_user(
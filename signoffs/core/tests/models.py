@@ -73,6 +73,10 @@ simple_revokable_signoff_type = RevokableSignoff.register(
     id="test.signoffs.simple_revokable_signoff"
 )
 
+form_signoff_type = BasicSignoff.register(
+    id="test.form_signoff", perm="auth.add_signoff"
+)
+
 
 def approval_signoff_form():
     class ApprovalSignoffForm(AbstractSignoffForm):
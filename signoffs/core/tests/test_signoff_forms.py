@@ -7,15 +7,7 @@ from signoffs.forms import AbstractSignoffForm, signoff_form_factory
 
 from . import fixtures, models
 
-
-class FormTestsSignoff(models.BasicSignoff):
-    signetModel = models.Signet
-    label = "Consent?"
-
-
-signoff_type = FormTestsSignoff.register(
-    id="test.form_signoff", perm="auth.add_signoff"
-)
+signoff_type = models.form_signoff_type
 
 
 class SignoffFormTests(SimpleTestCase):
@@ -37,6 +29,8 @@ class SignoffFormTests(SimpleTestCase):
 
 
 class SignoffWithUserTests(TestCase):
+    databases = {"default"}
+
     def setUp(self):
         self.formClass = signoff_form_factory(signoff_type=signoff_type)
 
@@ -1,11 +1,13 @@
 """
 App-independent tests for Signoff models - no app logic
 """
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.core import exceptions
 from django.test import SimpleTestCase, TestCase
 
-from signoffs import registry
+from signoffs import registry, settings
 from signoffs.signoffs import SignoffLogic
 
 from . import fixtures
@@ -19,6 +21,11 @@ signoff2 = BasicSignoff.register(
     logic=SignoffLogic(perm="auth.some_perm", revoke_perm="auth.revoke_perm"),
 )
 signoff3 = BasicSignoff.register(id="test.signoff3")
+# signoff types that share signoff1's Signet model
+signoffa = signoff1.register(id="test.signoffa")
+signoffb = signoff1.register(id="test.signoffb")
+
+SIGNET_DEFAULTS = {"sigil": "Anonymous"}
 
 
 class SimpleSignoffTypeTests(SimpleTestCase):
@@ -50,6 +57,8 @@ class SignoffTypeIntheritanceTests(SimpleTestCase):
 
 
 class SignoffTypeTests(TestCase):
+    databases = {"default"}
+
     @classmethod
     def setUpTestData(cls):
         cls.restricted_user = fixtures.get_user(username="restricted")
@@ -122,6 +131,8 @@ class SignoffTypeTests(TestCase):
 
 
 class SignoffQuerysetTests(TestCase):
+    databases = {"default"}
+
     @classmethod
     def setUpTestData(cls):
         u = fixtures.get_user(perms=("some_perm",))
@@ -194,8 +205,6 @@ class SignoffQuerysetTests(TestCase):
 
     def test_signoff_get_by_type(self):
         """test that signoff.get only retrieves signoffs of right type even when they share same Signet model"""
-        signoffa = signoff1.register(id="test.signoffa")
-        signoffb = signoff1.register(id="test.signoffb")
         other_user = fixtures.get_user()
         a1 = signoffa.create(user=self.user)
         a2 = signoffa.create(user=other_user)
@@ -247,6 +256,16 @@ class SignetModelTests(SimpleTestCase):
         o = Signet(signoff_id="test.signoff1", user=u)
         self.assertEqual(o.get_signet_defaults()["sigil"], "Daffy Duck")
 
+    @mock.patch.object(
+        settings,
+        "SIGNOFFS_SIGNET_DEFAULTS",
+        "signoffs.core.tests.test_signoff_models.SIGNET_DEFAULTS",
+    )
+    def test_signet_defaults_import_path(self):
+        u = get_user_model()(username="daffyduck")
+        o = Signet(signoff_id="test.signoff1", user=u)
+        self.assertEqual(o.get_signet_defaults(), SIGNET_DEFAULTS)
+
     def test_valid_signoff_type(self):
         s = registry.signoffs.get("test.signoff1")
         o = Signet(signoff_id="test.signoff1")
@@ -259,6 +278,8 @@ class SignetModelTests(SimpleTestCase):
 
 
 class SignetQuerysetTests(TestCase):
+    databases = {"default"}
+
     @classmethod
     def setUpTestData(cls):
         user = fixtures.get_user(
@@ -280,24 +301,30 @@ class SignetQuerysetTests(TestCase):
 
     def test_qs_basics(self):
         signoff_set = Signet.objects.filter(signoff_id="test.signoff1")
-        self.assertQuerysetEqual(
-            signoff_set.order_by("pk"), [so.signet for so in self.signoff1_set]
+        self.assertEqual(
+            list(signoff_set.order_by("pk").values_list("pk", flat=True)),
+            [so.signet.pk for so in self.signoff1_set],
         )
 
     def test_qs_signoffs(self):
         signoff_set = (
             Signet.objects.order_by("pk").filter(signoff_id="test.signoff1").signoffs()
         )
-        self.assertQuerysetEqual(signoff_set, self.signoff1_set)
+        self.assertEqual(
+            [s.signet.pk for s in signoff_set],
+            [so.signet.pk for so in self.signoff1_set],
+        )
 
     def test_qs_signoffs_filter(self):
         base_qs = Signet.objects.order_by("pk")
-        self.assertQuerysetEqual(
-            base_qs.signoffs(signoff_id="test.signoff1"), self.signoff1_set
+        self.assertEqual(
+            [s.signet.pk for s in base_qs.signoffs(signoff_id="test.signoff1")],
+            [so.signet.pk for so in self.signoff1_set],
         )
-        self.assertQuerysetEqual(base_qs.signoffs(signoff_id="test.signoff2"), [])
-        self.assertQuerysetEqual(
-            base_qs.signoffs(signoff_id="test.signoff3"), self.signoff3_set
+        self.assertEqual(base_qs.signoffs(signoff_id="test.signoff2"), [])
+        self.assertEqual(
+            [s.signet.pk for s in base_qs.signoffs(signoff_id="test.signoff3")],
+            [so.signet.pk for so in self.signoff3_set],
         )
 
     def test_qs_signoffs_performance(self):
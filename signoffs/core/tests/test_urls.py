@@ -0,0 +1,148 @@
+"""
+App-independent tests for url services - no app logic
+"""
+from types import SimpleNamespace
+
+from django.conf.urls.i18n import i18n_patterns
+from django.test import SimpleTestCase, override_settings
+from django.urls import NoReverseMatch, path, reverse, set_script_prefix
+from django.utils import translation
+
+from signoffs import checks
+from signoffs.core.urls import (
+    ApprovalInstanceUrls,
+    SignoffInstanceUrls,
+    SignoffUrlsManager,
+)
+from signoffs.core.urls import reverse as url_reverse
+
+from .models import BasicSignoff
+
+# language-prefixed URLconf for the cached_reverse tests (ROOT_URLCONF=__name__)
+urlpatterns = i18n_patterns(
+    path("signoff/", lambda request: None, name="i18n_signoff"),
+)
+
+
+class CachedReverseTests(SimpleTestCase):
+    def setUp(self):
+        url_reverse.clear_url_cache()
+
+    def test_cached_reverse(self):
+        self.assertEqual(url_reverse.cached_reverse("login"), reverse("login"))
+        kwargs = dict(signoff_id="test.signoff", pk=42)
+        self.assertEqual(
+            url_reverse.cached_reverse("detail", kwargs=kwargs),
+            reverse("detail", kwargs=kwargs),
+        )
+
+    def test_memoized(self):
+        url_reverse.cached_reverse("login")
+        url_reverse.cached_reverse("login")
+        self.assertEqual(url_reverse._reverse.cache_info().hits, 1)
+
+    def test_urlconf_change_clears_cache(self):
+        url_reverse.cached_reverse("login")
+        with override_settings(ROOT_URLCONF="signoffs.urls"):
+            with self.assertRaises(NoReverseMatch):
+                url_reverse.cached_reverse("login")
+        self.assertEqual(url_reverse.cached_reverse("login"), reverse("login"))
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_active_language(self):
+        with translation.override("en"):
+            self.assertEqual(url_reverse.cached_reverse("i18n_signoff"), "/en/signoff/")
+        with translation.override("fr"):
+            self.assertEqual(url_reverse.cached_reverse("i18n_signoff"), "/fr/signoff/")
+
+    def test_language_change_clears_cache(self):
+        url_reverse.cached_reverse("login")
+        with override_settings(LANGUAGE_CODE="fr"):
+            self.assertEqual(url_reverse._reverse.cache_info().currsize, 0)
+
+
+class InstanceUrlsTests(SimpleTestCase):
+    def test_no_url_name(self):
+        # no url name configured - instance is never consulted for a pk
+        urls = SignoffInstanceUrls(None)
+        self.assertEqual(urls.get_save_url(), "")
+        self.assertEqual(urls.get_revoke_url(), "")
+        self.assertEqual(ApprovalInstanceUrls(None).get_revoke_url(), "")
+
+    def test_url_templates(self):
+        signoff = SimpleNamespace(signet=SimpleNamespace(pk=7))
+        urls = SignoffInstanceUrls(
+            signoff,
+            save_url_name="save",
+            revoke_url_name="revoke",
+            save_url_template="/sign/",
+            revoke_url_template="/revoke/{pk}/",
+        )
+        self.assertEqual(urls.get_save_url(), "/sign/")
+        self.assertEqual(urls.get_revoke_url(), "/revoke/7/")
+        approval = SimpleNamespace(stamp=SimpleNamespace(pk=3))
+        urls = ApprovalInstanceUrls(
+            approval, revoke_url_name="revoke", revoke_url_template="/revoke/{pk}/"
+        )
+        self.assertEqual(urls.get_revoke_url(), "/revoke/3/")
+
+    def test_url_templates_script_prefix(self):
+        signoff = SimpleNamespace(signet=SimpleNamespace(pk=7))
+        urls = SignoffInstanceUrls(
+            signoff,
+            save_url_name="save",
+            revoke_url_name="revoke",
+            save_url_template="/sign/",
+            revoke_url_template="/revoke/{pk}/",
+        )
+        set_script_prefix("/sub/")
+        self.addCleanup(set_script_prefix, "/")
+        self.assertEqual(urls.get_save_url(), "/sub/sign/")
+        self.assertEqual(urls.get_revoke_url(), "/sub/revoke/7/")
+
+
+class UrlTemplateChecksTests(SimpleTestCase):
+    def signoff_type(self, **urls_kwargs):
+        """Return an unregistered signoff type with the given url service configuration"""
+        return type(
+            "UrlsSignoff",
+            (BasicSignoff,),
+            dict(id="test.urls_signoff", urls=SignoffUrlsManager(**urls_kwargs)),
+        )
+
+    def test_registered_types(self):
+        self.assertEqual(checks.check_url_templates(), [])
+
+    def test_consistent_template(self):
+        signoff_type = self.signoff_type(
+            save_url_name="login", save_url_template=reverse("login")
+        )
+        self.assertEqual(checks.url_template_errors([signoff_type]), [])
+
+    def test_inconsistent_template(self):
+        signoff_type = self.signoff_type(
+            save_url_name="login", save_url_template="/not/login/"
+        )
+        errors = checks.url_template_errors([signoff_type])
+        self.assertEqual([e.id for e in errors], ["signoffs.E002"])
+
+    def test_service_not_instantiated(self):
+        class OwnerUrls(SignoffInstanceUrls):
+            def __init__(self, signoff_instance, **kwargs):
+                super().__init__(signoff_instance, **kwargs)
+                self.signet_pk = signoff_instance.signet.pk  # needs a real owner
+
+        signoff_type = self.signoff_type(
+            service_class=OwnerUrls,
+            save_url_name="login",
+            save_url_template="/not/login/",
+        )
+        errors = checks.url_template_errors([signoff_type])
+        self.assertEqual([e.id for e in errors], ["signoffs.E002"])
+
+    def test_unknown_url_name(self):
+        signoff_type = self.signoff_type(
+            revoke_url_name="no_such_url", revoke_url_template="/revoke/{pk}/"
+        )
+        errors = checks.url_template_errors([signoff_type])
+        self.assertEqual([e.id for e in errors], ["signoffs.E001"])
@@ -16,22 +16,28 @@ class UtilsTests(SimpleTestCase):
         )
 
     def test_camel_to_snake(self):
-        self.assertEqual(
-            utils.camel_to_snake("camel2_camel2_case"), "camel2_camel2_case"
-        )
-        self.assertEqual(utils.camel_to_snake("NormalClassName"), "normal_class_name")
-        self.assertEqual(
-            utils.camel_to_snake("abstractHTTPResponseCode"),
-            "abstract_http_response_code",
-        )
-        self.assertEqual(
-            utils.camel_to_snake("HTTPResponseCodeXYZ"), "http_response_code_xyz"
+        cases = (
+            ("camel2_camel2_case", "camel2_camel2_case"),
+            ("NormalClassName", "normal_class_name"),
+            ("abstractHTTPResponseCode", "abstract_http_response_code"),
+            ("HTTPResponseCodeXYZ", "http_response_code_xyz"),
+            ("HTTPResponse", "http_response"),
+            ("VP9Codec", "vp9_codec"),
+            ("get2HTTPResponse", "get2_http_response"),
         )
+        for name, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(utils.camel_to_snake(name), expected)
 
     def test_id_to_camel(self):
-        self.assertEqual(utils.id_to_camel("NormalClassName"), "NormalClassName")
-        self.assertEqual(utils.id_to_camel("snake_snake_case"), "SnakeSnakeCase")
-        self.assertEqual(utils.id_to_camel("dot.separated-id"), "DotSeparatedId")
+        cases = (
+            ("NormalClassName", "NormalClassName"),
+            ("snake_snake_case", "SnakeSnakeCase"),
+            ("dot.separated-id", "DotSeparatedId"),
+        )
+        for name, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(utils.id_to_camel(name), expected)
 
     def test_dynamic_import(self):
         f = utils.dynamic_import("signoffs.core.utils.dynamic_import")
@@ -39,6 +45,29 @@ class UtilsTests(SimpleTestCase):
         f = utils.dynamic_import("signoffs.core.utils", "service")
         self.assertEqual(f, utils.service)
 
+    def test_service_memoized(self):
+        class Service:
+            def __init__(self, owner):
+                self.owner = owner
+
+        self.assertIs(utils.service(Service), utils.service(Service))
+        # no attributes to specialize - service class is injected as-is
+        self.assertIs(utils.service(Service).service_class, Service)
+        self.assertIs(
+            utils.service(Service, label="a"), utils.service(Service, label="a")
+        )
+        self.assertIsNot(
+            utils.service(Service, label="a"), utils.service(Service, label="b")
+        )
+        self.assertIs(
+            utils.service(Service, label="a", extra=1),
+            utils.service(Service, extra=1, label="a"),
+        )
+        # unhashable attributes can't be memoized, but still produce a service
+        self.assertTrue(
+            issubclass(utils.service(Service, labels=[]), utils.ServiceDescriptor)
+        )
+
 
 data = SimpleNamespace(
     obj1=SimpleNamespace(
@@ -56,6 +85,42 @@ class AccessorTests(SimpleTestCase):
         x = utils.Accessor("obj1__attr2")
         self.assertEqual(x.resolve(data), 42)
 
+    def test_resolve_safe(self):
+        def delete():
+            pass
+
+        delete.alters_data = True
+        obj = SimpleNamespace(delete=delete)
+        x = utils.Accessor("delete__alters_data")
+        with self.assertRaises(ValueError):
+            x.resolve(obj)
+        self.assertIsNone(x.resolve(obj, quiet=True))
+        self.assertTrue(x.resolve(obj, safe=False))
+
+    def test_resolve_traverses_once(self):
+        class Counted:
+            lookups = 0
+
+            @property
+            def obj(self):
+                Counted.lookups += 1
+                return SimpleNamespace(attr="Dent")
+
+        x = utils.Accessor("obj__missing")
+        with self.assertRaises(ValueError):
+            x.resolve(Counted())
+        self.assertEqual(Counted.lookups, 1)
+
+    def test_resolve_cache(self):
+        obj = SimpleNamespace(obj=SimpleNamespace(attr="Dent"))
+        x = utils.Accessor("obj__attr")
+        cache = {}
+        self.assertEqual(x.resolve(obj, cache=cache), "Dent")
+        obj.obj.attr = "Route"  # mutations are not seen until the cache is discarded
+        self.assertEqual(x.resolve(obj, cache=cache), "Dent")
+        self.assertEqual(x.resolve(obj, cache={}), "Route")
+        self.assertEqual(x.resolve(obj), "Route")
+
     def test_penultimate(self):
         x = utils.Accessor("obj2__obj__attr2")
         self.assertEqual(x.resolve(data), 66)
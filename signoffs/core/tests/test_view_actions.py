@@ -1,7 +1,7 @@
 """
 App-independent tests for view.actions - no app logic
 """
-from unittest.mock import Mock
+from unittest import mock
 
 import django_fsm as fsm
 from django.core.exceptions import ImproperlyConfigured
@@ -9,6 +9,7 @@ from django.db.models import Model, TextChoices, CharField
 from django.test import TestCase
 
 import signoffs.core.signing_order as so
+from signoffs import registry
 from signoffs.core import process as signoffs_process
 from signoffs.core.approvals import BaseApproval
 from signoffs.registry import register
@@ -18,6 +19,9 @@ from signoffs.views import actions
 from ..models.fields import ApprovalField, SignoffField
 from . import fixtures, models
 
+# signoff logic is stateless, so all test signoff types can share one instance
+add_signoff_logic = SignoffLogic(perm="auth.add_signoff")
+
 
 class ActionsTestsSignoff(models.BasicSignoff):
     signetModel = models.Signet
@@ -25,17 +29,20 @@ class ActionsTestsSignoff(models.BasicSignoff):
 
 
 signoff_type = ActionsTestsSignoff.register(
-    id="test.actions_signoff", logic=SignoffLogic(perm="auth.add_signoff")
+    id="test.actions_signoff", logic=add_signoff_logic
 )
 
 
 class ActionsSignoffFormTests(TestCase):
-    def setUp(self):
-        self.user = fixtures.get_user(perms=("add_signoff",))
-        self.data = dict(
-            signoff_id=signoff_type.id,
-            signed_off="on",
-        )
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = fixtures.get_user(perms=("add_signoff",))
+        cls.data = {
+            "signoff_id": signoff_type.id,
+            "signed_off": "on",
+        }
 
     def get_signoff_form(self, data=None):
         """Return a signoff form instance bound to class self.data"""
@@ -58,20 +65,37 @@ class ActionsSignoffFormTests(TestCase):
         self.assertTrue(bf.is_valid())
         self.assertFalse(bf.is_signed_off())
 
-    def test_invalid_signoff(self):
-        bf = self.get_signoff_form(
-            data=dict(signed_off="True", signoff_id="invalid.type")
-        )
-        self.assertIsNone(bf)
-
-    def test_invalid_data(self):
-        bf = self.get_signoff_form(data=dict(signed_off="True"))
-        self.assertIsNone(bf)
+    def test_signoff_type_memoized(self):
+        handler = actions.BasicSignoffFormHandler(dict(self.data))
+        with mock.patch.object(
+            registry, "find_signoff_type", wraps=registry.find_signoff_type
+        ) as find_signoff_type:
+            self.assertEqual(handler.get_signoff_type(), signoff_type)
+            self.assertEqual(handler.get_signoff_type(), signoff_type)
+            find_signoff_type.assert_called_once()
+            # a different signoff_id is looked up again
+            handler.data["signoff_id"] = "invalid.type"
+            self.assertIsNone(handler.get_signoff_type())
+            self.assertEqual(find_signoff_type.call_count, 2)
+
+    def test_invalid_inputs(self):
+        cases = (
+            dict(signed_off="True", signoff_id="invalid.type"),
+            dict(signed_off="True"),
+        )
+        for data in cases:
+            with self.subTest(data=data):
+                self.assertIsNone(self.get_signoff_form(data=data))
 
 
 class SignoffCommitterTests(TestCase):
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = fixtures.get_user(perms=("add_signoff",))
+
     def setUp(self):
-        self.user = fixtures.get_user(perms=("add_signoff",))
         self.signoff = signoff_type()
 
     def test_create(self):
@@ -83,6 +107,18 @@ class SignoffCommitterTests(TestCase):
         committer.sign(self.signoff)
         self.assertTrue(self.signoff.is_signed())
 
+    def test_sign_all(self):
+        calls = []
+
+        signoffs = [self.signoff, signoff_type(), signoff_type()]
+        committer = actions.BasicSignoffCommitter(
+            self.user, post_signoff_hook=calls.append
+        )
+        committer.sign_all(signoffs)
+        self.assertTrue(all(signoff.is_signed() for signoff in signoffs))
+        self.assertEqual(calls, signoffs)
+        self.assertTrue(committer.savepoint)
+
     def test_revoke(self):
         self.signoff.sign_if_permitted(self.user)
         committer = actions.BasicSignoffCommitter(self.user)
@@ -90,35 +126,62 @@ class SignoffCommitterTests(TestCase):
         self.assertFalse(self.signoff.is_signed())
 
     def test_post_signoff_hook(self):
-        hook = Mock()
+        calls = []
 
-        committer = actions.BasicSignoffCommitter(self.user, post_signoff_hook=hook)
+        committer = actions.BasicSignoffCommitter(
+            self.user, post_signoff_hook=calls.append
+        )
         committer.sign(self.signoff)
-        self.assertTrue(hook.called)
+        self.assertEqual(len(calls), 1)
 
     def test_post_revoke_hook(self):
-        hook = Mock()
+        calls = []
 
         self.signoff.sign_if_permitted(self.user)
-        committer = actions.BasicSignoffCommitter(self.user, post_revoke_hook=hook)
+        committer = actions.BasicSignoffCommitter(
+            self.user, post_revoke_hook=calls.append
+        )
         committer.revoke(self.signoff)
-        self.assertTrue(hook.called)
+        self.assertEqual(len(calls), 1)
 
 
 class BasicUserSignoffActionsTests(TestCase):
-    def setUp(self):
-        self.user = fixtures.get_user(perms=("add_signoff",))
-        self.data = dict(
-            signoff_id=signoff_type.id,
-            signed_off="on",
-        )
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = fixtures.get_user(perms=("add_signoff",))
+        cls.unprivileged_user = fixtures.get_user()
+        cls.data = {
+            "signoff_id": signoff_type.id,
+            "signed_off": "on",
+        }
 
     def test_create(self):
+        with mock.patch.object(
+            actions.BasicUserSignoffActions,
+            "validator_class",
+            wraps=actions.BasicSignoffValidator,
+        ) as validator_class:
+            action = actions.BasicUserSignoffActions(self.user, self.data)
+            self.assertEqual(action.forms.get_signoff_type(), signoff_type)
+            # components are constructed on first use, and only once
+            validator_class.assert_not_called()
+            self.assertIs(action.validator, action.validator)
+            validator_class.assert_called_once()
+        self.assertEqual(action.committer.user, self.user)
+
+    def test_assign_components(self):
         action = actions.BasicUserSignoffActions(self.user, self.data)
-        self.assertEqual(action.forms.get_signoff_type(), signoff_type)
+        validator = actions.BasicSignoffValidator(user=self.unprivileged_user)
+        committer = actions.BasicSignoffCommitter(user=self.unprivileged_user)
+        action.validator = validator
+        action.committer = committer
+        self.assertIs(action.validator, validator)
+        self.assertIs(action.committer, committer)
 
     def test_is_valid_signoff_request(self):
-        u = fixtures.get_user()
+        u = self.unprivileged_user
         u_action = actions.BasicUserSignoffActions(u, self.data)
         self.assertFalse(u_action.validator.is_valid_signoff_request(signoff_type()))
 
@@ -138,42 +201,75 @@ class BasicUserSignoffActionsTests(TestCase):
         action.signoff.save()
         self.assertTrue(action.signoff.is_signed())
 
-    def test_sign_signoff_invalid(self):
-        data = dict(signed_off="True", signoff_id="invalid.type")
-        d_action = actions.BasicUserSignoffActions(self.user, data)
-        self.assertFalse(d_action.sign_signoff())
-
-    def test_unsigned_signoff(self):
-        data = dict(signoff_id=signoff_type.id)
-        d_action = actions.BasicUserSignoffActions(self.user, data)
-        self.assertFalse(d_action.sign_signoff())
-
-    def test_sign_signoff_permission_denied(self):
-        u = fixtures.get_user()
-        u_action = actions.BasicUserSignoffActions(u, self.data)
-        self.assertFalse(u_action.sign_signoff())
+    def test_validate_sign_request(self):
+        action = actions.BasicUserSignoffActions(self.user, self.data)
+        signoff = action.validate_sign_request()
+        self.assertEqual(signoff.id, signoff_type.id)
+        self.assertFalse(signoff.is_signed())
+        self.assertIsNone(signoff.signet.user)
+        u_action = actions.BasicUserSignoffActions(self.unprivileged_user, self.data)
+        self.assertIsNone(u_action.validate_sign_request())
+        unsigned_data = dict(signoff_id=signoff_type.id)
+        action = actions.BasicUserSignoffActions(self.user, unsigned_data)
+        self.assertIsNone(action.validate_sign_request())
+
+    def test_validate_sign_request_without_get_unsigned_signoff(self):
+        class FormHandler:
+            """A form handler written before get_unsigned_signoff was added"""
+
+            def __init__(self, data):
+                self.data = data
+                self.handler = actions.BasicSignoffFormHandler(data)
+
+            def get_signed_signoff(self, user):
+                return self.handler.get_signed_signoff(user)
+
+        action = actions.BasicUserSignoffActions(
+            self.user, self.data, form_handler=FormHandler(self.data)
+        )
+        signoff = action.validate_sign_request()
+        self.assertEqual(signoff.id, signoff_type.id)
+        self.assertIsNone(signoff.signet.pk)  # signed in memory, but not saved
+
+    def test_sign_signoff_rejection_modes(self):
+        cases = (
+            ("invalid", self.user, dict(signed_off="True", signoff_id="invalid.type")),
+            ("unsigned", self.user, dict(signoff_id=signoff_type.id)),
+            ("permission denied", self.unprivileged_user, self.data),
+        )
+        for case, user, data in cases:
+            with self.subTest(case=case):
+                action = actions.BasicUserSignoffActions(user, data)
+                self.assertFalse(action.sign_signoff())
 
     def revoke_data(self):
         """sign a signoff and return data defining its revocation"""
         action = actions.BasicUserSignoffActions(self.user, self.data)
         action.sign_signoff()
         self.assertTrue(action.signoff.is_signed())
-        return dict(
-            signoff_id=signoff_type.id,
-            signet_pk=action.signoff.signet.pk,
-        )
+        return {
+            "signoff_id": signoff_type.id,
+            "signet_pk": action.signoff.signet.pk,
+        }
 
     def test_is_valid_revoke_request(self):
         action = actions.BasicUserSignoffActions(self.user, self.data)
         action.sign_signoff()
 
-        u = fixtures.get_user()
+        u = self.unprivileged_user
         u_action = actions.BasicUserSignoffActions(u, self.revoke_data())
         self.assertFalse(u_action.validator.is_valid_revoke_request(action.signoff))
 
         r_action = actions.BasicUserSignoffActions(self.user, self.revoke_data())
         self.assertTrue(r_action.validator.is_valid_revoke_request(action.signoff))
 
+    def test_revoke_form_loads_revoked_state(self):
+        r_action = actions.BasicUserSignoffActions(self.user, self.revoke_data())
+        revoke_form = r_action.forms.get_revoke_form()
+        self.assertTrue(revoke_form.is_valid())
+        with self.assertNumQueries(0):
+            self.assertTrue(revoke_form.cleaned_data["signoff"].is_signed())
+
     def test_invalid_revoke_request(self):
         action = actions.BasicUserSignoffActions(self.user, self.data)
         action.sign_signoff()
@@ -201,6 +297,19 @@ class BasicUserSignoffActionsTests(TestCase):
         r_action.revoke_signoff()
         self.assertFalse(r_action.signoff.is_signed())
 
+    def test_revoke_form_built_per_request(self):
+        r_action = actions.BasicUserSignoffActions(self.user, self.revoke_data())
+        forms = signoff_type.forms
+        with mock.patch.object(
+            forms, "get_revoke_form", wraps=forms.get_revoke_form
+        ) as get_revoke_form:
+            self.assertTrue(r_action.revoke_signoff(commit=False))
+            self.assertEqual(get_revoke_form.call_count, 1)
+            # the committed revoke validates a fresh form, not the one validated above
+            self.assertTrue(r_action.revoke_signoff())
+            self.assertEqual(get_revoke_form.call_count, 2)
+        self.assertFalse(r_action.revoke_signoff())  # nothing left to revoke
+
     def test_revoke_signoff_invalid(self):
         r_data = {**self.revoke_data(), "signet_pk": "invalid.type"}
         r_action = actions.BasicUserSignoffActions(self.user, r_data)
@@ -211,7 +320,7 @@ class BasicUserSignoffActionsTests(TestCase):
         self.assertFalse(r_action.revoke_signoff())
 
     def test_revoke_signoff_permission_denied(self):
-        u = fixtures.get_user()
+        u = self.unprivileged_user
         u_action = actions.BasicUserSignoffActions(u, self.revoke_data())
         self.assertFalse(u_action.revoke_signoff())
 
@@ -227,13 +336,16 @@ class ModelWithAmbiguousSignoffField(Model):
 
 
 class SignoffFieldUserActionsTests(TestCase):
-    def setUp(self):
-        self.user = fixtures.get_user(perms=("add_signoff",))
-        self.instance = ModelWithSignoffField.objects.create()
-        self.data = dict(
-            signoff_id=signoff_type.id,
-            signed_off="on",
-        )
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = fixtures.get_user(perms=("add_signoff",))
+        cls.instance = ModelWithSignoffField.objects.create()
+        cls.data = {
+            "signoff_id": signoff_type.id,
+            "signed_off": "on",
+        }
 
     def test_create(self):
         action = actions.SignoffFieldUserActions(self.user, self.instance, self.data)
@@ -251,10 +363,10 @@ class SignoffFieldUserActionsTests(TestCase):
         action = actions.SignoffFieldUserActions(self.user, self.instance, self.data)
         action.sign_signoff()
         self.assertTrue(action.signoff.is_signed())
-        return dict(
-            signoff_id=signoff_type.id,
-            signet_pk=action.signoff.signet.pk,
-        )
+        return {
+            "signoff_id": signoff_type.id,
+            "signet_pk": action.signoff.signet.pk,
+        }
 
     def test_revoke_signoff(self):
         r_action = actions.SignoffFieldUserActions(self.user, self.instance, self.revoke_data())
@@ -290,19 +402,24 @@ class ActionsApproval(BaseApproval):
     label = "Test Approval"
 
     first_signoff = models.ApprovalSignoff.register(
-        id="test.approval.actions.first", logic=SignoffLogic(perm="auth.add_signoff")
+        id="test.approval.actions.first", logic=add_signoff_logic
     )
     final_signoff = models.ApprovalSignoff.register(
-        id="test.approval.actions.final", logic=SignoffLogic(perm="auth.add_signoff")
+        id="test.approval.actions.final", logic=add_signoff_logic
     )
 
     signing_order = so.SigningOrder(first_signoff, final_signoff)
 
 
 class ApprovalSignoffCommitterTests(TestCase):
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = fixtures.get_user(perms=("add_signoff",))
+        cls.approval = ActionsApproval.create()
+
     def setUp(self):
-        self.user = fixtures.get_user(perms=("add_signoff",))
-        self.approval = ActionsApproval.create()
         self.signoff = ActionsApproval.first_signoff(stamp=self.approval.stamp)
 
     def test_approve_post_signoff_hook(self):
@@ -316,28 +433,35 @@ class ApprovalSignoffCommitterTests(TestCase):
 
     def test_post_signoff_hook(self):
         """Custom post_signoff_hook runs in an atomic transaction to maintain integrity of triggered DB ops"""
-        hook = Mock()
+        calls = []
 
-        committer = actions.BasicSignoffCommitter(self.user, post_signoff_hook=hook)
+        committer = actions.BasicSignoffCommitter(
+            self.user, post_signoff_hook=calls.append
+        )
         committer.sign(self.approval.first_signoff(stamp=self.approval.stamp))
         committer.sign(self.approval.final_signoff(stamp=self.approval.stamp))
         self.assertFalse(self.approval.is_approved())
-        self.assertEqual(hook.call_count, 2)
+        self.assertEqual(len(calls), 2)
 
 
 class BasicUserApprovalActionsTests(TestCase):
-    def setUp(self):
-        self.user = fixtures.get_user(perms=("add_signoff",))
-        self.approval = ActionsApproval.create()
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = fixtures.get_user(perms=("add_signoff",))
+        cls.unprivileged_user = fixtures.get_user()
+        cls.approval = ActionsApproval.create()
 
     def get_data(self, signoff=None, stamp=None, signed_off="on"):
         signoff = signoff or self.approval.get_next_signoff(for_user=self.user)
-        stamp = stamp or self.approval.stamp
-        return dict(
-            signoff_id=signoff.id if signoff else self.approval.first_signoff.id,
-            signed_off=signed_off,
-            stamp=stamp.id,
-        )
+        signoff_id = signoff.id if signoff else self.approval.first_signoff.id
+        stamp_id = (stamp or self.approval.stamp).id
+        return {
+            "signoff_id": signoff_id,
+            "signed_off": signed_off,
+            "stamp": stamp_id,
+        }
 
     def test_create(self):
         action = actions.BasicUserApprovalActions(
@@ -348,8 +472,25 @@ class BasicUserApprovalActionsTests(TestCase):
             action.signoff_actions.forms.get_signoff_type(), self.approval.first_signoff
         )
 
+    def test_signoff_actions_constructed_on_demand(self):
+        with mock.patch.object(
+            actions.BasicUserApprovalActions,
+            "signoff_actions_class",
+            wraps=actions.BasicUserSignoffActions,
+        ) as signoff_actions_class:
+            action = actions.BasicUserApprovalActions(
+                self.user, self.get_data(), self.approval
+            )
+            self.assertFalse(action.is_valid_approve_request())
+            signoff_actions_class.assert_not_called()
+            self.assertIs(action.signoff_actions, action.signoff_actions)
+            signoff_actions_class.assert_called_once()
+        signoff_actions = actions.BasicUserSignoffActions(self.user, self.get_data())
+        action.signoff_actions = signoff_actions
+        self.assertIs(action.signoff_actions, signoff_actions)
+
     def test_is_valid_approval_signoff_request(self):
-        u = fixtures.get_user()
+        u = self.unprivileged_user
         u_action = actions.BasicUserApprovalActions(u, self.get_data(), self.approval)
         self.assertFalse(
             u_action.validator.is_valid_signoff_request(self.approval.first_signoff())
@@ -366,8 +507,10 @@ class BasicUserApprovalActionsTests(TestCase):
         action = actions.BasicUserApprovalActions(
             self.user, self.get_data(), self.approval
         )
+        self.assertIsNone(action.signoff)
         self.assertTrue(action.sign_signoff())
         self.assertTrue(action.signoff.is_signed())
+        self.assertEqual(action.signoff.subject, self.approval)
         self.assertEqual(self.approval.signoffs.count(), 1)
 
     def test_sign_to_approval(self):
@@ -406,11 +549,11 @@ class BasicUserApprovalActionsTests(TestCase):
             action.sign_signoff()
             self.assertTrue(action.signoff.is_signed())
             signoff = action.signoff
-        return dict(
-            signoff_id=signoff.id,
-            signet_pk=signoff.signet.pk,
-            stamp=signoff.signet.stamp_id,
-        )
+        return {
+            "signoff_id": signoff.id,
+            "signet_pk": signoff.signet.pk,
+            "stamp": signoff.signet.stamp_id,
+        }
 
     def test_is_valid_revoke_signoff_request(self):
         action = actions.BasicUserApprovalActions(
@@ -419,7 +562,7 @@ class BasicUserApprovalActionsTests(TestCase):
         action.sign_signoff()
         signoff = action.signoff
 
-        u = fixtures.get_user()
+        u = self.unprivileged_user
         u_action = actions.BasicUserApprovalActions(
             u, self.revoke_data(signoff=signoff), self.approval
         )
@@ -430,6 +573,23 @@ class BasicUserApprovalActionsTests(TestCase):
         )
         self.assertTrue(r_action.validator.is_valid_revoke_request(signoff))
 
+    def test_verify_consistent_stamp_id_no_queries(self):
+        action = actions.BasicUserApprovalActions(
+            self.user, self.get_data(), self.approval
+        )
+        action.sign_signoff()
+        signet = type(action.signoff.signet).objects.get(pk=action.signoff.signet.pk)
+        signoff = signet.signoff
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                actions.verify_consistent_stamp_id(
+                    self.approval, signoff, self.approval.stamp.pk
+                )
+            )
+            self.assertFalse(
+                actions.verify_consistent_stamp_id(self.approval, signoff, -1)
+            )
+
     def test_revoke_signoff(self):
         r_action = actions.BasicUserApprovalActions(
             self.user, self.revoke_data(), self.approval
@@ -468,6 +628,21 @@ class BasicUserApprovalActionsTests(TestCase):
         action.approve()
         self.assertTrue(self.approval.is_approved())
 
+    def test_approve_only_when_ready(self):
+        with mock.patch.object(
+            actions.BasicUserApprovalActions, "approve", autospec=True
+        ) as approve:
+            action = actions.BasicUserApprovalActions(
+                self.user, self.get_data(), self.approval
+            )
+            action.sign_signoff()
+            approve.assert_not_called()  # signing order not yet complete
+            action = actions.BasicUserApprovalActions(
+                self.user, self.get_data(), self.approval
+            )
+            action.sign_signoff()
+            approve.assert_called_once_with(action)
+
     def test_revoke_approve_request(self):
         action = actions.BasicUserApprovalActions(
             self.user, self.get_data(), self.approval
@@ -543,30 +718,41 @@ class FsmActionsProcessModel(Model):
 
 
 class ApprovalProcessUserActionsTests(TestCase):
+    databases = {"default"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = fixtures.get_user(perms=("add_signoff",))
+
     def setUp(self):
-        self.user = fixtures.get_user(perms=("add_signoff",))
         self.fsm = FsmActionsProcessModel.objects.create()
         self.approval_process = self.fsm.process
 
-    def get_data(self, signoff=None, stamp=None, signed_off="on"):
-        approval = self.approval_process.get_next_approval()
+    def get_action(self, data=None, approval=None):
+        """Return process actions for self.user, by default signing the next available approval"""
+        if approval is None:
+            approval = self.approval_process.get_next_available_approval()
+        if data is None:
+            data = self.get_data(approval=approval)
+        return actions.ApprovalProcessUserActions(
+            self.user, data, approval_process=self.approval_process, approval=approval
+        )
+
+    def get_data(self, signoff=None, stamp=None, signed_off="on", approval=None):
+        approval = approval or self.approval_process.get_next_approval()
         if not approval:
             return {}
         signoff = signoff or approval.get_next_signoff(for_user=self.user)
-        stamp = stamp or approval.stamp
-        return dict(
-            signoff_id=signoff.id if signoff else approval.first_signoff.id,
-            signed_off=signed_off,
-            stamp=stamp.id,
-        )
+        signoff_id = signoff.id if signoff else approval.first_signoff.id
+        stamp_id = (stamp or approval.stamp).id
+        return {
+            "signoff_id": signoff_id,
+            "signed_off": signed_off,
+            "stamp": stamp_id,
+        }
 
     def test_create(self):
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         self.assertEqual(type(action.signoff_actions), actions.BasicUserSignoffActions)
         self.assertEqual(
             action.signoff_actions.forms.get_signoff_type(),
@@ -574,33 +760,18 @@ class ApprovalProcessUserActionsTests(TestCase):
         )
 
     def test_sign_signoff(self):
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         self.assertTrue(action.sign_signoff())
         self.assertTrue(action.signoff.is_signed())
         self.assertEqual(action.approval.signoffs.count(), 1)
 
     def test_sign_to_approval(self):
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         action.sign_signoff()
         self.assertFalse(action.approval.is_approved())
         self.assertEqual(self.fsm.state, self.fsm.States.STATE0)
 
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         action.sign_signoff()
         self.assertTrue(action.approval.is_approved())
         self.assertEqual(self.fsm.state, self.fsm.States.STATE1)
@@ -608,22 +779,12 @@ class ApprovalProcessUserActionsTests(TestCase):
     def test_sign_to_approval2(self):
         self.fsm.sign_and_approve(self.user)
         self.assertEqual(self.fsm.state, self.fsm.States.STATE1)
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         action.sign_signoff()
         self.assertFalse(action.approval.is_approved())
         self.assertEqual(self.fsm.state, self.fsm.States.STATE1)
 
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         action.sign_signoff()
         self.assertTrue(action.approval.is_approved())
         self.assertEqual(self.fsm.state, self.fsm.States.STATE2)
@@ -635,52 +796,29 @@ class ApprovalProcessUserActionsTests(TestCase):
             if not approval:
                 return {}
             signoff = approval.signoffs[-1]
-        return dict(
-            signoff_id=signoff.id,
-            signet_pk=signoff.signet.pk,
-            stamp=signoff.signet.stamp_id,
-        )
+        return {
+            "signoff_id": signoff.id,
+            "signet_pk": signoff.signet.pk,
+            "stamp": signoff.signet.stamp_id,
+        }
 
     def test_is_valid_approval_revoke_request(self):
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         action.sign_signoff()
-        r_action = actions.ApprovalProcessUserActions(
-            self.user,
-            {},
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        r_action = self.get_action({})
         self.assertFalse(r_action.is_valid_approval_revoke_request())
 
         self.fsm.sign_and_approve(self.user)
         self.assertEqual(self.fsm.state, self.fsm.States.STATE1)
-        r_action = actions.ApprovalProcessUserActions(
-            self.user,
-            {},
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_approved_approvals()[-1],
+        r_action = self.get_action(
+            {}, approval=self.approval_process.get_approved_approvals()[-1]
         )
         self.assertTrue(r_action.is_valid_approval_revoke_request())
 
     def test_revoke_signoff(self):
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.get_data(),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action()
         action.sign_signoff()
-        r_action = actions.ApprovalProcessUserActions(
-            self.user,
-            self.revoke_data(action.signoff),
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        r_action = self.get_action(self.revoke_data(action.signoff))
         self.assertTrue(r_action.revoke_signoff())
         self.assertFalse(r_action.signoff.is_signed())
 
@@ -689,12 +827,7 @@ class ApprovalProcessUserActionsTests(TestCase):
         approval = self.approval_process.get_approved_approvals()[-1]
         approval.stamp.approved = False
         self.fsm.state = self.fsm.States.STATE0
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            {},
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_next_available_approval(),
-        )
+        action = self.get_action({})
         action.approve()
         self.assertTrue(approval.is_approved())
         self.assertEqual(self.fsm.state, self.fsm.States.STATE1)
@@ -704,11 +837,8 @@ class ApprovalProcessUserActionsTests(TestCase):
         self.fsm.sign_and_approve(self.user)
         self.assertEqual(self.fsm.state, self.fsm.States.STATE2)
 
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            {},
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_approved_approvals()[-1],
+        action = self.get_action(
+            {}, approval=self.approval_process.get_approved_approvals()[-1]
         )
         self.assertTrue(action.is_valid_approval_revoke_request())
         self.assertTrue(action.revoke_approval())
@@ -716,11 +846,8 @@ class ApprovalProcessUserActionsTests(TestCase):
         self.assertEqual(action.approval.signoffs.count(), 0)
         self.assertEqual(self.fsm.state, self.fsm.States.STATE1)
 
-        action = actions.ApprovalProcessUserActions(
-            self.user,
-            {},
-            approval_process=self.approval_process,
-            approval=self.approval_process.get_approved_approvals()[-1],
+        action = self.get_action(
+            {}, approval=self.approval_process.get_approved_approvals()[-1]
         )
         self.assertTrue(action.revoke_approval())
         self.assertEqual(self.fsm.state, self.fsm.States.STATE0)
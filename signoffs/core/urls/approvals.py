@@ -5,10 +5,10 @@ In fact, the default renderers assume an approval knows the URL for revoke reque
 This component can be extended to provide flexible url services to approval instances.
 They are generally "injected" into the Approval Type using a `ApprovalUrlsManager` service descriptor
 """
-from django.urls import reverse
-
 from signoffs.core.utils import service
 
+from .reverse import cached_reverse, script_prefixed
+
 
 class ApprovalInstanceUrls:
     """
@@ -17,23 +17,29 @@ class ApprovalInstanceUrls:
 
     # Define URL patterns for revoking approvals
     revoke_url_name: str = ""
-
-    def __init__(self, approval_instance, revoke_url_name=None):
+    # Optional fast path - a root-relative URL, formatted with the stamp pk, that bypasses reverse()
+    #   e.g., "/approvals/revoke/{pk}/"; must agree with the named URL (see signoffs.checks)
+    #   The script prefix is prepended, but not a language prefix - don't use templates for i18n_patterns URLs.
+    revoke_url_template: str = ""
+
+    def __init__(
+        self, approval_instance, revoke_url_name=None, revoke_url_template=None
+    ):
         """Override default actions, or leave parameter None to use class default"""
         self.approval = approval_instance
         self.revoke_url_name = revoke_url_name or self.revoke_url_name
+        self.revoke_url_template = revoke_url_template or self.revoke_url_template
 
     def get_revoke_url(self, args=None, kwargs=None):
         """Return the URL for requests to revoke the approval"""
-        args = args or [
-            self.approval.stamp.pk,
-        ]
-        kwargs = kwargs or {}
-        return (
-            reverse(self.revoke_url_name, args=args, kwargs=kwargs)
-            if self.revoke_url_name
-            else ""
-        )
+        if not self.revoke_url_name:
+            return ""
+        if self.revoke_url_template and not (args or kwargs):
+            return script_prefixed(
+                self.revoke_url_template.format(pk=self.approval.stamp.pk)
+            )
+        args = args or (self.approval.stamp.pk,)
+        return cached_reverse(self.revoke_url_name, args=args, kwargs=kwargs)
 
 
 class ApprovalUrlsManager(service(ApprovalInstanceUrls)):
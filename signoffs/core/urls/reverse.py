@@ -0,0 +1,60 @@
+"""
+Memoized URL reversal for the url services.
+
+Signoff and approval renderers reverse the same handful of url names, for every instance on a page.
+Reversed URLs are cached per url name, args, kwargs, and active urlconf / script prefix / language,
+and the cache is cleared whenever a setting the URL configuration depends on changes.
+Code that calls `django.urls.clear_url_caches()` directly should also call `clear_url_cache()`.
+"""
+from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils import translation
+
+# Settings that change the URLs reverse() produces for the same arguments
+URL_SETTINGS = {
+    "ROOT_URLCONF",
+    "FORCE_SCRIPT_NAME",
+    "USE_I18N",
+    "LANGUAGE_CODE",
+    "LANGUAGES",
+}
+
+
+@lru_cache(maxsize=1024)
+def _reverse(viewname, urlconf, script_prefix, language, args, kwargs):
+    """script_prefix and language are only part of the cache key - `reverse` reads them from the current thread"""
+    return reverse(viewname, urlconf=urlconf, args=args, kwargs=dict(kwargs))
+
+
+def cached_reverse(viewname, args=None, kwargs=None):
+    """Drop-in replacement for `django.urls.reverse(viewname, args=args, kwargs=kwargs)` that memoizes results"""
+    try:
+        return _reverse(
+            viewname,
+            get_urlconf(),
+            get_script_prefix(),
+            translation.get_language(),
+            tuple(args) if args else (),
+            tuple(sorted(kwargs.items())) if kwargs else (),
+        )
+    except TypeError:  # unhashable or unorderable arguments - can't be cached
+        return reverse(viewname, args=args, kwargs=kwargs)
+
+
+def clear_url_cache():
+    """Discard all memoized URLs"""
+    _reverse.cache_clear()
+
+
+def script_prefixed(url):
+    """Return the given root-relative url, e.g. a url template, under the script prefix in effect for this thread"""
+    return get_script_prefix() + url.lstrip("/")
+
+
+@receiver(setting_changed)
+def _clear_url_cache_on_url_setting_change(*, setting, **kwargs):
+    if setting in URL_SETTINGS:
+        clear_url_cache()
@@ -6,10 +6,10 @@ This component can be extended to provide flexible url services to `Signoff` ins
 They are generally "injected" into the Signoff Type using a `SignoffUrlsManager` service descriptor
 """
 
-from django.urls import reverse
-
 from signoffs.core.utils import service
 
+from .reverse import cached_reverse, script_prefixed
+
 
 class SignoffInstanceUrls:
     """
@@ -19,32 +19,45 @@ class SignoffInstanceUrls:
     # Define URL patterns for saving and revoking signoffs
     save_url_name: str = ""
     revoke_url_name: str = ""
+    # Optional fast path - root-relative URLs that bypass reverse(), e.g., "/signoffs/revoke/{pk}/"
+    #   revoke template is formatted with the signet pk; must agree with the named URL (see signoffs.checks)
+    #   The script prefix is prepended, but not a language prefix - don't use templates for i18n_patterns URLs.
+    save_url_template: str = ""
+    revoke_url_template: str = ""
 
-    def __init__(self, signoff_instance, save_url_name=None, revoke_url_name=None):
+    def __init__(
+        self,
+        signoff_instance,
+        save_url_name=None,
+        revoke_url_name=None,
+        save_url_template=None,
+        revoke_url_template=None,
+    ):
         """Override default actions, or leave parameter None to use class default"""
         self.signoff = signoff_instance
         self.save_url_name = save_url_name or self.save_url_name
         self.revoke_url_name = revoke_url_name or self.revoke_url_name
+        self.save_url_template = save_url_template or self.save_url_template
+        self.revoke_url_template = revoke_url_template or self.revoke_url_template
 
     def get_save_url(self, args=None, kwargs=None):
         """Return the URL for requests to save the signoff"""
-        args = args or ()
-        kwargs = kwargs or {}
-        return (
-            reverse(self.save_url_name, args=args, kwargs=kwargs)
-            if self.save_url_name
-            else ""
-        )
+        if not self.save_url_name:
+            return ""
+        if self.save_url_template and not (args or kwargs):
+            return script_prefixed(self.save_url_template)
+        return cached_reverse(self.save_url_name, args=args, kwargs=kwargs)
 
     def get_revoke_url(self, args=None, kwargs=None):
         """Return the URL for requests to revoke this signoff"""
+        if not self.revoke_url_name:
+            return ""
+        if self.revoke_url_template and not (args or kwargs):
+            return script_prefixed(
+                self.revoke_url_template.format(pk=self.signoff.signet.pk)
+            )
         args = args or (self.signoff.signet.pk,)
-        kwargs = kwargs or {}
-        return (
-            reverse(self.revoke_url_name, args=args, kwargs=kwargs)
-            if self.revoke_url_name
-            else ""
-        )
+        return cached_reverse(self.revoke_url_name, args=args, kwargs=kwargs)
 
 
 class SignoffUrlsManager(service(SignoffInstanceUrls)):
@@ -2,25 +2,39 @@
 Utility functions and classes
 """
 import re
+import weakref
+from functools import cached_property, lru_cache
 from importlib import import_module
 
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
 
 split_caps_run = re.compile(r"(.)([A-Z][a-z]+)")
-to_snake_case = re.compile(r"([a-z0-9])([A-Z])")
-id_separators = re.compile(r"[_\-.]")
+# single-pass equivalent of split_caps_run followed by a split on each lower-to-upper case boundary
+snake_case_boundary = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=.)(?=[A-Z][a-z])")
+# normalize the id separators "-" and "." to "_", so ids can be split on a single character
+id_separators = str.maketrans("-.", "__")
 
 
+@lru_cache(maxsize=2048)
 def camel_to_snake(name):
     """Convert CamelCaseName to snake_case_name"""
     # based on: https://stackoverflow.com/a/1176023/1993525
-    name = split_caps_run.sub(r"\1_\2", name)
-    return to_snake_case.sub(r"\1_\2", name).lower()
+    return snake_case_boundary.sub("_", name).lower()
 
 
+@lru_cache(maxsize=2048)
 def id_to_camel(name):
     """Convert arbitrary identifier using dot or snake notation into CamelCase"""
-    return "".join(el[:1].capitalize() + el[1:] for el in re.split(id_separators, name))
+    if not ("_" in name or "-" in name or "." in name):
+        return name[:1].capitalize() + name[1:]
+    return "".join(
+        [
+            el[:1].capitalize() + el[1:]
+            for el in name.translate(id_separators).split("_")
+        ]
+    )
 
 
 def dynamic_import(abs_module_path, obj_name=None):
@@ -38,6 +52,11 @@ def dynamic_import(abs_module_path, obj_name=None):
     return target_obj
 
 
+_missing = object()  # sentinel for attribute lookups with a default
+# (Accessor class, path) -> live Accessor
+_accessor_pool = weakref.WeakValueDictionary()
+
+
 class Accessor(str):
     """
     A string describing a path from one object to another via attributes accesses.
@@ -52,7 +71,21 @@ class Accessor(str):
     ALTERS_DATA_ERROR_FMT = "Refusing to call {method}() because `.alters_data = True`"
     LOOKUP_ERROR_FMT = "Failed lookup for attribute [{attr}] in {obj}, when resolving the accessor `{accessor}`"
 
-    def resolve(self, obj, safe=True, quiet=False):
+    bits: tuple  # attribute names along the path
+
+    def __new__(cls, value=""):
+        # Accessors are immutable, so equal accessors are shared (flyweight) while any are in use
+        key = (cls, value) if isinstance(value, str) else None
+        accessor = _accessor_pool.get(key) if key else None
+        if accessor is None:
+            accessor = super().__new__(cls, value)
+            # ... and the path is split and compiled exactly once, on construction
+            accessor.bits = tuple(accessor.split(cls.SEPARATOR)) if accessor else ()
+            if key:
+                _accessor_pool[key] = accessor
+        return accessor
+
+    def resolve(self, obj, safe=True, quiet=False, cache=None):
         """
         Return an attribute described by the accessor by traversing the attributes of object
 
@@ -69,48 +102,70 @@ class Accessor(str):
         :param obj: The root object to traverse.
         :param bool safe: Don't call anything with `alters_data = True`
         :param bool quiet: Smother all exceptions and instead return `None`
+        :param dict cache: Optional memo, e.g., one per render, to resolve each (obj, accessor) pair only once.
+            Caller owns the cache and must discard it if any object along the path is mutated.
         :return: resolved target object
 
         :raises TypeError, AttributeError, KeyError, ValueError: (unless `quiet` == `True`)
         """
 
-        def traverse(current, bit):
-            """Traverse to current.bit and return the result or raise ValueError if no such relation"""
+        if not self:
+            return None
+
+        if cache is not None:
+            # obj is kept with the result, so its id can't be recycled while the entry is live
+            key = (id(obj), self)
+            entry = cache.get(key)
+            if entry is not None and entry[0] is obj:
+                return entry[1]
+            value = self.resolve(obj, safe=safe, quiet=quiet)
+            cache[key] = (obj, value)
+            return value
+
+        # Single attribute - nothing to traverse
+        if self.SEPARATOR not in self:
             try:
-                return getattr(current, bit)
+                return getattr(obj, self)
             except AttributeError:
+                if quiet:
+                    return None
                 raise ValueError(
-                    self.LOOKUP_ERROR_FMT.format(attr=bit, obj=current, accessor=self)
-                )
-
-        def check_safe(item):
-            """Raise ValueError if item is callable and item.alters_data but safe==True"""
-            if callable(current) and safe and getattr(current, "alters_data", False):
-                raise ValueError(
-                    self.ALTERS_DATA_ERROR_FMT.format(method=repr(current))
+                    self.LOOKUP_ERROR_FMT.format(attr=self, obj=obj, accessor=self)
                 )
 
         # Short-circuit if the object has an attribute with the exact name of the accessor,
+        #   looked up with a default, so the common miss doesn't raise and catch an AttributeError.
+        current = getattr(obj, self, _missing)
+        if current is not _missing:
+            return current
         try:
-            return None if self == "" else getattr(obj, self)
-        except AttributeError:
-            try:
-                current = obj
-                for bit in self.bits:
-                    current = traverse(current, bit)
-                    check_safe(current)
-                    # Important that we break in None case; otherwise a relationship spanning
-                    #  a null-key will raise an exception in the next iteration, instead of defaulting.
-                    if current is None:
-                        break
-                return current
-            except Exception:
-                if not quiet:
-                    raise
-
-    @property
-    def bits(self):
-        return self.split(self.SEPARATOR) if self != "" else ()
+            # Single walk along the path - each attribute is looked up once, and checked if safe.
+            current = obj
+            for bit in self.bits:
+                try:
+                    current = getattr(current, bit)
+                except AttributeError:
+                    raise ValueError(
+                        self.LOOKUP_ERROR_FMT.format(
+                            attr=bit, obj=current, accessor=self
+                        )
+                    )
+                if (
+                    safe
+                    and callable(current)
+                    and getattr(current, "alters_data", False)
+                ):
+                    raise ValueError(
+                        self.ALTERS_DATA_ERROR_FMT.format(method=repr(current))
+                    )
+                # Important that we break in None case; otherwise a relationship spanning
+                #  a null-key will raise an exception in the next iteration, instead of defaulting.
+                if current is None:
+                    break
+            return current
+        except Exception:
+            if not quiet:
+                raise
 
     def get_field(self, model):
         """
@@ -118,19 +173,8 @@ class Accessor(str):
         """
         if not hasattr(model, "_meta"):
             return
-
-        field = None
-        for bit in self.bits:
-            try:
-                field = model._meta.get_field(bit)
-            except FieldDoesNotExist:
-                break
-
-            if hasattr(field, "remote_field"):
-                rel = getattr(field, "remote_field", None)
-                model = getattr(rel, "model", model)
-
-        return field
+        # key on the model class - instances may be unhashable and must not be kept alive by the cache
+        return _get_model_field(self.bits, model._meta.model)
 
     def penultimate_accessor(self):
         """
@@ -144,6 +188,11 @@ class Accessor(str):
             'user__profile', 'title'
         ```
         """
+        return self._penultimate_split
+
+    @cached_property
+    def _penultimate_split(self):
+        """Split once per accessor - repeated drill-downs reuse the same left-part Accessor"""
         path, _, remainder = self.rpartition(self.SEPARATOR)
         return Accessor(path), remainder
 
@@ -163,6 +212,29 @@ class Accessor(str):
         return accessor.resolve(obj, quiet=quiet), remainder
 
 
+@lru_cache(maxsize=4096)
+def _get_model_field(bits, model):
+    """Return the django model field at the end of the path of bits from model, following relations."""
+    field = None
+    for bit in bits:
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            break
+
+        rel = getattr(field, "remote_field", None)
+        if rel is not None:
+            model = getattr(rel, "model", model)
+
+    return field
+
+
+@receiver(class_prepared)
+def _clear_model_field_cache(sender, **kwargs):
+    """A newly prepared model may resolve lazy relations that are already cached"""
+    _get_model_field.cache_clear()
+
+
 class ServiceDescriptor:
     """
     A descriptor used to "inject" instances of a "service" class into its owner's instances.
@@ -202,6 +274,7 @@ def service(service_class, **kwargs):
     Factory to return specialized service descriptors.
 
     :return: a `ServiceDescriptor` for a specialized subclass of `service_class`, that has `kwargs` as class attributes
+        (or for `service_class` itself, when there are no `kwargs`)
 
     Usage:
     ```
@@ -221,11 +294,37 @@ def service(service_class, **kwargs):
         ... assert str(o.a_service) == "A special service for Owner with whazoo"
     ```
     """
-    specialized_service = type(service_class.__name__, (service_class,), kwargs)
+    return _specialized_descriptor(ServiceDescriptor, "Service", service_class, kwargs)
+
+
+def _specialized_descriptor(descriptor_class, suffix, service_class, attrs):
+    """
+    Return a `descriptor_class` subclass that injects a subclass of `service_class` specialized with `attrs`
+
+    The same arguments, with attrs in any order, always produce the identical descriptor class.
+    """
+    try:
+        return _cached_specialized_descriptor(
+            descriptor_class, suffix, service_class, tuple(sorted(attrs.items()))
+        )
+    except TypeError:  # unhashable attrs can't be memoized
+        return _cached_specialized_descriptor.__wrapped__(
+            descriptor_class, suffix, service_class, attrs.items()
+        )
+
+
+@lru_cache(maxsize=None)
+def _cached_specialized_descriptor(descriptor_class, suffix, service_class, attrs):
+    # nothing to specialize - inject the service_class itself rather than an empty subclass
+    specialized_service = (
+        type(service_class.__name__, (service_class,), dict(attrs))
+        if attrs
+        else service_class
+    )
 
-    descriptor_name = f"{service_class.__name__}Service"
+    descriptor_name = f"{service_class.__name__}{suffix}"
     descriptor = type(
-        descriptor_name, (ServiceDescriptor,), dict(service_class=specialized_service)
+        descriptor_name, (descriptor_class,), dict(service_class=specialized_service)
     )
     return descriptor
 
@@ -267,15 +366,9 @@ def class_service(service_class, **kwargs):
     :return: a `ClassServiceDescriptor` for a specialized subclass of `service_class`,
     that has `kwargs` as class attributes
     """
-    specialized_service = type(service_class.__name__, (service_class,), kwargs)
-
-    descriptor_name = f"{service_class.__name__}ClassService"
-    descriptor = type(
-        descriptor_name,
-        (ClassServiceDescriptor,),
-        dict(service_class=specialized_service),
+    return _specialized_descriptor(
+        ClassServiceDescriptor, "ClassService", service_class, kwargs
     )
-    return descriptor
 
 
 __all__ = [
@@ -24,7 +24,7 @@ typically be handled.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import partial
 from typing import Callable, Protocol
 
@@ -40,6 +40,21 @@ from signoffs.signoffs import AbstractSignoff
 
 User = get_user_model()
 
+_unset = object()  # sentinel for memoized values that may legitimately be None
+
+
+# Shared defaults for optional verifiers and hooks
+
+
+def _always_valid(signoff=None) -> bool:
+    """Default verifier - nothing to check"""
+    return True
+
+
+def _no_hook(signoff) -> None:
+    """Default hook - nothing to do"""
+    return None
+
 
 ##################
 #  SIGNOFF ACTIONS
@@ -69,7 +84,7 @@ class BasicSignoffValidator:
     """
 
     user: User
-    verify_signet: Callable[[AbstractSignoff], bool] = lambda signoff: True
+    verify_signet: Callable[[AbstractSignoff], bool] = _always_valid
     """Optional function to validate request data against a signoff, or None to skip"""
 
     def is_valid_signoff_request(self, signoff: AbstractSignoff) -> bool:
@@ -105,23 +120,32 @@ class BasicSignoffCommitter:
 
     user: User
     """The user who is signing the signoff"""
-    post_signoff_hook: Callable[[AbstractSignoff], None] = lambda s: None
+    post_signoff_hook: Callable[[AbstractSignoff], None] = _no_hook
     """A function that takes the signed signoff as argument, called in atomic transaction after signing"""
-    post_revoke_hook: Callable[[AbstractSignoff], None] = lambda s: None
+    post_revoke_hook: Callable[[AbstractSignoff], None] = _no_hook
     """A function that takes the revoked signoff as argument, called in atomic transaction after revoking"""
+    savepoint: bool = True
+    """False to skip the savepoint when already in a transaction - an error then rolls back the whole transaction"""
 
     def sign(self, signoff: AbstractSignoff):
         """Sign and commit the signoff for given user - no validation, just do it!"""
-        with transaction.atomic():
+        with transaction.atomic(savepoint=self.savepoint):
             signoff.sign(self.user)
             self.post_signoff_hook(signoff)
 
     def revoke(self, signoff: AbstractSignoff):
         """Revoke the signoff for given user and commit changes to DB - no validation, just do it!"""
-        with transaction.atomic():
+        with transaction.atomic(savepoint=self.savepoint):
             signoff.revoke(self.user)
             self.post_revoke_hook(signoff)
 
+    def sign_all(self, signoffs):
+        """Sign and commit all the signoffs for given user in a single transaction - no validation, just do it!"""
+        committer = replace(self, savepoint=False)
+        with transaction.atomic():
+            for signoff in signoffs:
+                committer.sign(signoff)
+
 
 class SignoffRequestFormHandler(Protocol):
     """Basic API to provision and validate forms from signoff request data"""
@@ -136,6 +160,14 @@ class SignoffRequestFormHandler(Protocol):
         """Validate data against signoff form, return signed but unsaved signoff or None if form doesn't validate"""
         ...
 
+    def get_unsigned_signoff(self) -> AbstractSignoff:
+        """
+        Validate data against signoff form, return the signoff it would sign, without signing it, or None
+
+        Optional - handlers without it fall back to `get_signed_signoff` for validate-only requests.
+        """
+        ...
+
     def get_revoke_form(self):
         """Return a revoke form bound to data or None if no valid signoff form could be constructed"""
         ...
@@ -160,13 +192,21 @@ class BasicSignoffFormHandler:
     signoff_id_key: str = "signoff_id"
     """default name of data key (i.e., form field) for retrieving signoff_id from data dict"""
 
+    # memo for get_signoff_type - not a dataclass field
+    _signoff_type = (_unset, None)  # (signoff_id, signoff type)
+
     def get_signoff_type(self):
-        """Return the signoff type indicated by `data[signoff_id_key]`, or None"""
+        """
+        Return the signoff type indicated by `data[signoff_id_key]`, or None
+
+        Looked up once per signoff_id - both the signoff and revoke forms need it.
+        """
         signoff_id = self.data.get(self.signoff_id_key, None)
-        try:
-            return signoffs.registry.get_signoff_type(signoff_id)
-        except ImproperlyConfigured:  # invalid signoff_id in the data
-            return None
+        memo_id, signoff_type = self._signoff_type
+        if memo_id is _unset or memo_id != signoff_id:
+            signoff_type = signoffs.registry.find_signoff_type(signoff_id)
+            self._signoff_type = (signoff_id, signoff_type)
+        return signoff_type
 
     def get_signoff_form(self):
         """Return the signoff form bound to data or None if no valid signoff form could be constructed"""
@@ -184,6 +224,16 @@ class BasicSignoffFormHandler:
             signoff.subject = self.signoff_subject
         return signoff
 
+    def get_unsigned_signoff(self):
+        """Validate data against signoff form, return the signoff it would sign, without signing it, or None"""
+        signoff_form = self.get_signoff_form()
+        if not signoff_form or not signoff_form.is_signed_off():
+            return None
+        signoff = signoff_form.instance.signoff
+        if self.signoff_subject:
+            signoff.subject = self.signoff_subject
+        return signoff
+
     def get_revoke_form(self):
         """Return a revoke form bound to data or None if no valid signoff form could be constructed"""
         signoff_type = self.get_signoff_type()
@@ -218,9 +268,10 @@ def verify_consistent_signet_id(signoff, request_signet_id=None) -> bool:
 
 def get_verify_signet(kwargs, signet_id_key="signet_id"):
     """Helper to return a `verify_signet` function with correct signature for use with `BasicSignoffValidator`"""
-    return partial(
-        verify_consistent_signet_id, request_signet_id=kwargs.get(signet_id_key, None)
-    )
+    request_signet_id = kwargs.get(signet_id_key, None)
+    if not request_signet_id:
+        return _always_valid  # no signet_id in request - nothing to check
+    return partial(verify_consistent_signet_id, request_signet_id=request_signet_id)
 
 
 class BasicUserSignoffActions:
@@ -236,6 +287,17 @@ class BasicUserSignoffActions:
     validator_class: SignoffValidator = BasicSignoffValidator
     committer_class: SignoffCommitter = BasicSignoffCommitter
 
+    # one instance per request - subclasses that don't declare __slots__ get a __dict__ as usual
+    __slots__ = (
+        "user",
+        "data",
+        "forms",
+        "_validator",
+        "_committer",
+        "kwargs",
+        "signoff",
+    )
+
     def __init__(
         self,
         user: User,
@@ -255,13 +317,36 @@ class BasicUserSignoffActions:
         self.user = user
         self.data = data
         self.forms = form_handler or self.form_handler_class(data)
-        self.validator = validator or self.validator_class(
-            user=user, verify_signet=get_verify_signet(kwargs)
-        )
-        self.committer = committer or self.committer_class(user=user)
+        # validator and committer are only needed to handle a request - constructed on first use
+        self._validator = validator
+        self._committer = committer
         self.kwargs = kwargs
         self.signoff = None  # populated by calling sign_ or revoke_signoff
 
+    @property
+    def validator(self):
+        """The `SignoffValidator` for the user's requests"""
+        if self._validator is None:
+            self._validator = self.validator_class(
+                user=self.user, verify_signet=get_verify_signet(self.kwargs)
+            )
+        return self._validator
+
+    @validator.setter
+    def validator(self, validator):
+        self._validator = validator
+
+    @property
+    def committer(self):
+        """The `SignoffCommitter` for the user's requests"""
+        if self._committer is None:
+            self._committer = self.committer_class(user=self.user)
+        return self._committer
+
+    @committer.setter
+    def committer(self, committer):
+        self._committer = committer
+
     # NOT USED - moved to validator logic, see above  delete me
     # def verify_consistent_signet_id(self, signoff) -> bool:
     #     """As an extra data integrity check, revoke URL's may also contain the signet_id - check it matches"""
@@ -293,6 +378,23 @@ class BasicUserSignoffActions:
             return self.signoff_success(self.signoff)
         return self.signoff_failed(self.signoff)
 
+    def validate_sign_request(self):
+        """
+        Return the signoff that `sign_signoff` would sign, or None if the request is not valid
+
+        Validation only - the signoff is not signed, not even in memory, so nothing is thrown away on failure.
+        Form handlers that don't provide `get_unsigned_signoff` sign the signoff in memory instead, but never save it.
+        """
+        get_unsigned_signoff = getattr(self.forms, "get_unsigned_signoff", None)
+        signoff = (
+            get_unsigned_signoff()
+            if get_unsigned_signoff
+            else self.forms.get_signed_signoff(self.user)
+        )
+        if signoff and self.validator.is_valid_signoff_request(signoff):
+            return signoff
+        return None
+
     # "Template Method" hooks: to extend / override revoke_signoff without duplicating core algorithm
 
     def revoke_success(self, signoff):
@@ -316,14 +418,27 @@ class BasicUserSignoffActions:
         There is no way to "revoke" a signoff without committing the change.  Call again to do the actual revoke.
         :::
         """
-        self.signoff = self.forms.get_revoked_signoff(self.user)
-
-        if self.signoff and self.validator.is_valid_revoke_request(self.signoff):
+        self.signoff, is_valid = self._build_and_validate_revoke()
+        if is_valid:
             if commit:
-                self.committer.revoke(self.signoff)
+                self._commit_revoke(self.signoff)
             return self.revoke_success(self.signoff)
         return self.revoke_failed(self.signoff)
 
+    def _build_and_validate_revoke(self):
+        """
+        Build and validate the revoke form, once per revoke request
+
+        :return: 2-tuple (the signoff to be revoked or None, True iff the revoke request is valid)
+        """
+        signoff = self.forms.get_revoked_signoff(self.user)
+        is_valid = bool(signoff) and self.validator.is_valid_revoke_request(signoff)
+        return signoff, is_valid
+
+    def _commit_revoke(self, signoff):
+        """Revoke the validated signoff - the committer revokes and runs its post-revoke hook atomically"""
+        self.committer.revoke(signoff)
+
 
 class SignoffFieldUserActions(BasicUserSignoffActions):
     """
@@ -438,8 +553,8 @@ class ApprovalSignoffValidator(BasicSignoffValidator):
         self,
         user: User,
         approval: AbstractApproval,
-        verify_signet: Callable[[AbstractSignoff], bool] = lambda signoff: True,
-        verify_stamp: Callable[[AbstractSignoff], bool] = lambda signoff: True,
+        verify_signet: Callable[[AbstractSignoff], bool] = _always_valid,
+        verify_stamp: Callable[[AbstractSignoff], bool] = _always_valid,
     ):
         """
         Initialize validator for signoffs on the given approval.
@@ -489,13 +604,17 @@ def verify_consistent_stamp_id(approval, signoff=None, request_stamp_id=None):
     Return True iff data relations for approval, signoff, and request are self-consistent
 
     Validates that signoff.stamp, if it exists, is same object as approval.stamp, and optionally a stamp_id from request
+    Compares raw FK values only - never dereferences `signoff.signet.stamp`, so no queries are issued.
     """
     if not approval:
         return False
+    if signoff is None and not request_stamp_id:
+        return True  # nothing to compare - the common case for approve / revoke approval requests
+    stamp_id = approval.stamp.pk
     signoff_stamp_id = getattr(signoff.signet, "stamp_id", None) if signoff else None
-    return approval.stamp.id == (
-        request_stamp_id or approval.stamp.id
-    ) and approval.stamp.id == (signoff_stamp_id or approval.stamp.id)
+    return stamp_id == (request_stamp_id or stamp_id) and stamp_id == (
+        signoff_stamp_id or stamp_id
+    )
 
 
 def get_verify_stamp(approval, kwargs, stamp_id_key="stamp_id"):
@@ -528,6 +647,18 @@ class BasicUserApprovalActions:
     signoff_actions_class = BasicUserSignoffActions
     """Default `signoff_actions` is constructed from the other components."""
 
+    __slots__ = (
+        "user",
+        "data",
+        "approval",
+        "verify_stamp",
+        "validator",
+        "_signoff_actions",
+        "_committer",
+        "kwargs",
+        "signoff",
+    )
+
     def __init__(
         self,
         user,
@@ -557,33 +688,50 @@ class BasicUserApprovalActions:
             verify_signet=get_verify_signet(kwargs),
             verify_stamp=self.verify_stamp,
         )
-        committer = committer or self.committer_class(
-            user,
-            post_signoff_hook=self.process_signoff,
-            post_revoke_hook=self.process_revoked_signoff,
-        )
-        forms = self.signoff_actions_class.form_handler_class(
-            self.data, signoff_subject=self.approval
-        )
-        self.signoff_actions = signoff_actions or self.signoff_actions_class(
-            user,
-            data,
-            form_handler=forms,
-            validator=self.validator,
-            committer=committer,
-            **kwargs,
-        )
+        # signoff actions are only needed for signoff requests - constructed on first use
+        self._signoff_actions = signoff_actions
+        self._committer = committer
         self.kwargs = kwargs
+        self.signoff = None  # populated by calling sign_ or revoke_signoff
 
     @property
-    def signoff(self):
-        """Populated by calling sign_ or revoke_signoff"""
+    def signoff_actions(self):
+        """The `SignoffRequestActions` that sign and revoke signoffs on the approval"""
+        if self._signoff_actions is None:
+            committer = self._committer or self.committer_class(
+                self.user,
+                post_signoff_hook=self.process_signoff,
+                post_revoke_hook=self.process_revoked_signoff,
+            )
+            forms = self.signoff_actions_class.form_handler_class(
+                self.data, signoff_subject=self.approval
+            )
+            self._signoff_actions = self.signoff_actions_class(
+                self.user,
+                self.data,
+                form_handler=forms,
+                validator=self.validator,
+                committer=committer,
+                **self.kwargs,
+            )
+        return self._signoff_actions
+
+    @signoff_actions.setter
+    def signoff_actions(self, signoff_actions):
+        self._signoff_actions = signoff_actions
+
+    def _bind_signoff(self):
+        """Set self.signoff from the signoff_actions, with the approval as its subject"""
         signoff = self.signoff_actions.signoff
         # override the signoff.subject with approval, which might be bound to a higher-level subject,
         #   like an approval_process.  But don't alter the approval type - validation will catch inconsistencies.
-        if signoff and (not signoff.subject or signoff.subject == self.approval):
-            signoff.subject = self.approval
-        return signoff
+        if signoff:
+            subject = signoff.subject
+            if subject is not self.approval and (
+                not subject or subject == self.approval
+            ):
+                signoff.subject = self.approval
+        self.signoff = signoff
 
     @property
     def forms(self):
@@ -598,7 +746,13 @@ class BasicUserApprovalActions:
 
         :param bool commit: False to validate the form and sign self.signoff, but not commit signet to DB.
         """
-        return self.signoff_actions.sign_signoff(commit=commit)
+        signed = self.signoff_actions.sign_signoff(commit=commit)
+        self._bind_signoff()
+        return signed
+
+    def validate_sign_request(self):
+        """Return the signoff on this approval that `sign_signoff` would sign, or None if request is not valid"""
+        return self.signoff_actions.validate_sign_request()
 
     def revoke_signoff(self, commit=True):
         """
@@ -611,7 +765,9 @@ class BasicUserApprovalActions:
         There is no way to "revoke" a signoff without committing the change.  Call again to do the actual revoke.
         :::
         """
-        return self.signoff_actions.revoke_signoff(commit=commit)
+        revoked = self.signoff_actions.revoke_signoff(commit=commit)
+        self._bind_signoff()
+        return revoked
 
     # ApprovalActions Protocol
 
@@ -677,8 +833,8 @@ class ApprovalProcessSignoffValidator(ApprovalSignoffValidator):
         user: User,
         approval: AbstractApproval,
         approval_process: ApprovalsProcess,
-        verify_signet: Callable[[AbstractSignoff], bool] = lambda signoff: True,
-        verify_stamp: Callable[[AbstractSignoff], bool] = lambda signoff: True,
+        verify_signet: Callable[[AbstractSignoff], bool] = _always_valid,
+        verify_stamp: Callable[[AbstractSignoff], bool] = _always_valid,
     ):
         """
         Initialize validator for signoffs on the given approval process.
@@ -741,6 +897,8 @@ class ApprovalProcessUserActions(BasicUserApprovalActions):
 
     validator_class: SignoffValidator = ApprovalProcessSignoffValidator
 
+    __slots__ = ("approval_process",)
+
     def __init__(
         self,
         user,
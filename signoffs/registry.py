@@ -1,34 +1,59 @@
 """
     All Behavioural "Types" are loaded in a global registry to they can be accessed anywhere.
 """
+import sys
+import warnings
+from functools import cached_property
 
 from django.core.exceptions import ImproperlyConfigured
-from persisting_theory import Registry
+from django.utils.module_loading import autodiscover_modules
 
 
-class ObjectRegistry(Registry):
+class ObjectRegistry(dict):
     """Generic base class for efficiently registering a bunch of objects that have an id attribute to use as name"""
 
     object_type = object
     name_attr = "id"
+    look_into = None
+    """Deprecated: name of the module `autodiscover()` imports from each installed app"""
 
     def validate(self, data):
         """Return True iff the data can is a unique, vaild candidate for storage in this registry"""
-        class_validator = getattr(data, "validate", lambda: True)
+        class_validator = getattr(data, "validate", None)
         return (
             issubclass(data, self.object_type)
             and not getattr(data, self.name_attr) in self
-            and class_validator()
+            and (class_validator is None or class_validator())
         )
 
     def prepare_name(self, data, name=None):
         """Name (key) in registry will ordinarily be data.id, but can be overridden"""
-        return name or getattr(data, self.name_attr)
+        # interned, so lookups with the same (interned) id compare by identity
+        return sys.intern(name or getattr(data, self.name_attr))
 
     def register(self, *data, name=None, **kwargs):
         """Allow for multiple objects to be registered at once, name is ignored, obj.name_attr used instead"""
         for obj in data:
-            super().register(obj, **kwargs)
+            if not self.validate(obj):
+                raise ValueError(
+                    f"{obj} is not a valid value for {type(self).__name__} registry"
+                )
+            self[self.prepare_name(obj)] = obj
+
+    def autodiscover(self, *args, **kwargs):
+        """
+        Deprecated: import the `look_into` module from every installed app, as `persisting_theory.Registry` did.
+
+        `SignoffsConfig.ready()` already autodiscovers `settings.SIGNOFFS_AUTODISCOVER_MODULE` - use that instead.
+        Arguments accepted by `persisting_theory.Registry.autodiscover` are ignored.
+        """
+        warnings.warn(
+            f"{type(self).__name__}.autodiscover() is deprecated and will be removed in the next release; "
+            "Signoffs autodiscovers settings.SIGNOFFS_AUTODISCOVER_MODULE on app ready.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        autodiscover_modules(self.look_into)
 
 
 class SignoffTypes(ObjectRegistry):
@@ -36,7 +61,7 @@ class SignoffTypes(ObjectRegistry):
 
     look_into = "signoffs"
 
-    @property
+    @cached_property
     def object_type(self):
         """defer dependency to prevent cyclical imports"""
         import signoffs.core.signoffs
@@ -45,7 +70,7 @@ class SignoffTypes(ObjectRegistry):
 
 
 signoffs = SignoffTypes()
-"""Singleton - the Signoff Types registry. `(see persisting_theory.Registry)`"""
+"""Singleton - the Signoff Types registry, a dict of Signoff Types keyed by id"""
 
 
 def get_signoff_type(signoff_id_or_type):
@@ -60,17 +85,27 @@ def get_signoff_type(signoff_id_or_type):
     )
     if signoff_type is None:
         raise ImproperlyConfigured(
-            f"Signoff Type {signoff_type} must be registered before it can be used."
+            f"Signoff Type {signoff_id_or_type} must be registered before it can be used."
         )
     return signoff_type
 
 
+def find_signoff_type(signoff_id_or_type, default=None):
+    """
+    Return a registered Signoff Type, or default if no such type was registered.
+    Like `get_signoff_type`, but for lookups where a missing type is expected, e.g., unvalidated request data.
+    """
+    if isinstance(signoff_id_or_type, str):
+        return signoffs.get(signoff_id_or_type, default)
+    return default if signoff_id_or_type is None else signoff_id_or_type
+
+
 class ApprovalTypes(ObjectRegistry):
     """Keep a reference to all Approval Types"""
 
     look_into = "approvals"
 
-    @property
+    @cached_property
     def object_type(self):
         """defer dependency to prevent cyclical imports"""
         import signoffs.core.approvals
@@ -79,7 +114,7 @@ class ApprovalTypes(ObjectRegistry):
 
 
 approvals = ApprovalTypes()
-"""Singleton - the Approval Types registry. `(see persisting_theory.Registry)`"""
+"""Singleton - the Approval Types registry, a dict of Approval Types keyed by id"""
 
 
 def get_approval_type(approval_id_or_type):
@@ -99,6 +134,16 @@ def get_approval_type(approval_id_or_type):
     return approval_type
 
 
+def find_approval_type(approval_id_or_type, default=None):
+    """
+    Return a registered Approval Type, or default if no such type was registered.
+    Like `get_approval_type`, but for lookups where a missing type is expected, e.g., unvalidated request data.
+    """
+    if isinstance(approval_id_or_type, str):
+        return approvals.get(approval_id_or_type, default)
+    return default if approval_id_or_type is None else approval_id_or_type
+
+
 def get_approval_id(approval_id_or_type):
     """
     Return the str approval.id for an approval, approval_type, or approval_id object.
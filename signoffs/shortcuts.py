@@ -9,7 +9,7 @@ from signoffs import registry
 
 def get_signet_or_404(signoff_type, signet_pk, **kwargs):
     """Return Signet with given pk, for the given Signoff Type or id, or raise Http404"""
-    signoff = registry.get_signoff_type(signoff_type)
+    signoff = registry.find_signoff_type(signoff_type)
     if signoff is None:
         raise Http404(f"No registered signoff with id: {signoff_type}")
     return get_object_or_404(
@@ -25,7 +25,7 @@ def get_signoff_or_404(signoff_type, signet_pk, **kwargs):
 
 def get_approval_stamp_or_404(approval_type, stamp_pk, **kwargs):
     """Return ApprovalStamp instance with given pk for the given Approval Type or id, or raise Http404"""
-    approval = registry.get_approval_type(approval_type)
+    approval = registry.find_approval_type(approval_type)
     if approval is None:
         raise Http404(f"No registered approval with id: {approval_type}")
     return get_object_or_404(
@@ -33,7 +33,7 @@ def get_approval_stamp_or_404(approval_type, stamp_pk, **kwargs):
     )
 
 
-def get_approval_or_404(approval_type, stamp_pk):
+def get_approval_or_404(approval_type, stamp_pk, **kwargs):
     """Return Approval of given type or id, backed by StampModel with given pk, or raise Http404"""
-    stamp = get_approval_stamp_or_404(approval_type, stamp_pk)
+    stamp = get_approval_stamp_or_404(approval_type, stamp_pk, **kwargs)
     return stamp.approval
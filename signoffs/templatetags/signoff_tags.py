@@ -37,7 +37,9 @@ def render_signoff(context, signoff_instance, action="__call__", **kwargs):
 
     kwargs are passed to action method
     """
-    method = getattr(signoff_instance.render, action, signoff_instance.render.__call__)
+    renderer = signoff_instance.render
+    # the renderer itself is the default __call__ action
+    method = getattr(renderer, action, renderer)
     return method(**kwargs, context=context)
 
 
@@ -61,9 +63,14 @@ def render_approval_signoff(
     kwargs are passed to action method
     """
     user = _get_request_user(context, **kwargs)
-    if not approval.can_revoke_signoff(signoff_instance, user):
+    # Only check the permission used by the part being rendered - show_revoke applies to the signet,
+    #   show_form to the form, and can_sign evaluates the signing order, once per signoff rendered.
+    part = action
+    if action == "__call__":
+        part = "signet" if signoff_instance.is_signed() else "form"
+    if part != "form" and not approval.can_revoke_signoff(signoff_instance, user):
         kwargs["show_revoke"] = False
-    if not approval.can_sign(user, signoff_instance):
+    if part != "signet" and not approval.can_sign(user, signoff_instance):
         kwargs["show_form"] = False
     return render_signoff(context, signoff_instance, action=action, **kwargs)
 
@@ -3,7 +3,7 @@ Tests for signoff Types registries
 """
 from django.test import SimpleTestCase
 
-from signoffs.registry import signoffs
+from signoffs.registry import find_signoff_type, signoffs
 from tests.test_app import models
 
 
@@ -17,3 +17,24 @@ class TestSignoffsRegistry(SimpleTestCase):
     def test_signoff_type(self):
         o = models.Signet(signoff_id="test_app.agree")
         self.assertEqual(o.signoff_type, signoffs.get("test_app.agree"))
+
+    def test_find_signoff_type(self):
+        s = signoffs.get("test_app.agree")
+        self.assertEqual(find_signoff_type("test_app.agree"), s)
+        self.assertEqual(find_signoff_type(s), s)
+        self.assertIsNone(find_signoff_type("test_app.no_such_signoff"))
+        self.assertIsNone(find_signoff_type(None))
+        self.assertEqual(find_signoff_type(None, default=s), s)
+
+    def test_register_invalid(self):
+        s = signoffs.get("test_app.agree")
+        with self.assertRaises(ValueError):
+            signoffs.register(s)  # already registered
+        with self.assertRaises(ValueError):
+            signoffs.register(models.Signet)  # not a Signoff Type
+        self.assertIs(signoffs["test_app.agree"], s)
+
+    def test_autodiscover_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            signoffs.autodiscover()
+        self.assertIn("test_app.agree", signoffs)
@@ -1,6 +1,7 @@
 """
 Test App - tests for shortcuts
 """
+from django.http import Http404
 from django.test import TestCase
 
 from signoffs import shortcuts
@@ -34,3 +35,13 @@ class ShortcutTests(TestCase):
             self.approval.id, self.approval.stamp.pk
         )
         self.assertEqual(approval, self.approval)
+        with self.assertRaises(Http404):
+            shortcuts.get_approval_or_404(
+                self.approval.id, self.approval.stamp.pk, approved=True
+            )
+
+    def test_unknown_type_404(self):
+        with self.assertRaises(Http404):
+            shortcuts.get_signet_or_404("test_app.no_such_signoff", 1)
+        with self.assertRaises(Http404):
+            shortcuts.get_approval_stamp_or_404("test_app.no_such_approval", 1)
@@ -1,6 +1,8 @@
 """
 App-dependent tests for signoff template tags
 """
+from unittest import mock
+
 from django.template import Context, Template
 from django.test import TestCase
 
@@ -295,3 +297,17 @@ class RenderApprovalTagTests(TestCase):
             ),
         )
         self.assertEqual(out, "0")
+
+    def test_render_approval_signoff_checks_rendered_part(self):
+        signoff = self.signed_signoff()
+        template = Template(
+            "{% load signoff_tags %}{% render_approval_signoff approval signoff %}"
+        )
+        # a signed signoff renders its signet, so the signing order is not consulted
+        with mock.patch.object(self.approval, "can_sign") as can_sign:
+            self.render_template(template, signoff=signoff)
+        can_sign.assert_not_called()
+        # while an unsigned signoff renders a form, so its revoke permission is not
+        with mock.patch.object(self.approval, "can_revoke_signoff") as can_revoke:
+            self.render_template(template, signoff=self.signoff_type())
+        can_revoke.assert_not_called()